@@ -0,0 +1,20 @@
+from alembic import op
+
+revision = "0004_add_composite_indexes"
+down_revision = "0002_add_projects_flows"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Composite indexes matching the ownership WHERE clauses, so lookups are a single btree probe.
+    # Each one leads with the column of a single-column index, which it replaces.
+    op.create_index("ix_projects_owner_id_id", "projects", ["owner_id", "id"])
+    op.drop_index("ix_projects_owner_id", table_name="projects")
+    op.create_index("ix_flows_project_id_id", "flows", ["project_id", "id"])
+    op.drop_index("ix_flows_project_id", table_name="flows")
+
+def downgrade():
+    op.create_index("ix_flows_project_id", "flows", ["project_id"])
+    op.drop_index("ix_flows_project_id_id", table_name="flows")
+    op.create_index("ix_projects_owner_id", "projects", ["owner_id"])
+    op.drop_index("ix_projects_owner_id_id", table_name="projects")
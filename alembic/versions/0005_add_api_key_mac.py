@@ -0,0 +1,22 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_add_api_key_mac"
+down_revision = "0004_add_composite_indexes"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # HMAC-SHA256 of the plaintext key under API_KEY_SECRET. New keys store only
+    # this; existing bcrypt-hashed keys are no longer accepted and the startup
+    # seed re-issues the admin key.
+    op.add_column("api_keys", sa.Column("key_mac", sa.LargeBinary(length=32), nullable=True))
+    op.create_index("ix_api_keys_key_mac", "api_keys", ["key_mac"], unique=True)
+    op.alter_column("api_keys", "key_hash", existing_type=sa.String(length=255), nullable=True)
+
+def downgrade():
+    # Keys issued with only a MAC cannot be converted back to bcrypt hashes
+    op.execute("DELETE FROM api_keys WHERE key_hash IS NULL")
+    op.alter_column("api_keys", "key_hash", existing_type=sa.String(length=255), nullable=False)
+    op.drop_index("ix_api_keys_key_mac", table_name="api_keys")
+    op.drop_column("api_keys", "key_mac")
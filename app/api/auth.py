@@ -1,11 +1,16 @@
-from datetime import datetime, timezone
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import verify_api_key
+from app.api.examples import EXAMPLE_TIMESTAMP
+from app.core.security import api_key_mac
 from app.db.session import get_db
 from app.models.api_key import ApiKey
 from app.models.user import User
@@ -13,37 +18,108 @@ from app.models.user import User
 router = APIRouter(tags=["auth"])
 security = HTTPBearer(auto_error=False)
 
+# Recently verified API keys: key_mac -> (user_id, expires_at).
+# Revoked keys keep working in this process for at most the TTL.
+# Only touched from the event loop, so no locking is needed.
+_AUTH_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Minimum time between last_used_at writes for the same key
+_LAST_USED_UPDATE_INTERVAL = timedelta(seconds=60)
+
+# Locations the startup seed may have written the admin API key file to
+_ADMIN_KEY_PATHS = (
+    Path("admin_api_key.txt"),
+    Path("/tmp/admin_api_key.txt"),
+    Path("/app/admin_api_key.txt"),
+)
+
+# "Email: ..." / "API Key: ..." lines in the admin key file
+_ADMIN_KEY_LINE_RE = re.compile(r"^(API Key|Email):[ \t]*(.*)$", re.M)
+
+# Parsed admin key file: (path, mtime, email, api_key)
+_ADMIN_KEY_CACHE: Optional[tuple[Path, float, Optional[str], Optional[str]]] = None
+
 
 class UserResponse(BaseModel):
     """User response model."""
     id: int = Field(..., description="User ID")
     email: str = Field(..., description="User email")
-    created_at: str = Field(..., description="ISO 8601 timestamp in UTC")
+    created_at: datetime = Field(..., description="ISO 8601 timestamp in UTC")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "email": "user@example.com",
-                "created_at": "2025-12-31T00:00:00Z"
+                "created_at": EXAMPLE_TIMESTAMP
             }
         }
+    )
 
 
-def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Security(security),
-    db: Session = Depends(get_db)
-) -> User:
+def _read_admin_key_file() -> Optional[tuple[Optional[str], Optional[str]]]:
     """
-    Authenticate user via API key from Authorization header.
-    Raises 401 if authentication fails.
+    Read (email, api_key) from the seeded admin key file.
+    
+    The file is written once at seed time, so the parsed result is cached and
+    only re-read when the file's mtime changes.
+    Returns None if no key file exists.
+    """
+    global _ADMIN_KEY_CACHE
+    
+    if _ADMIN_KEY_CACHE is not None:
+        path, mtime, email, api_key = _ADMIN_KEY_CACHE
+        try:
+            if path.stat().st_mtime == mtime:
+                return email, api_key
+        except OSError:
+            pass
+        _ADMIN_KEY_CACHE = None
+    
+    for path in _ADMIN_KEY_PATHS:
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            continue
+        
+        with open(path, "r") as f:
+            fields = dict(_ADMIN_KEY_LINE_RE.findall(f.read()))
+        
+        api_key = fields.get("API Key", "").strip() or None
+        email = fields.get("Email", "").strip() or None
+        
+        _ADMIN_KEY_CACHE = (path, mtime, email, api_key)
+        return email, api_key
+    
+    return None
+
+
+async def _require_bearer(
+    credentials: Optional[HTTPAuthorizationCredentials] = Security(security)
+) -> HTTPAuthorizationCredentials:
+    """
+    Reject requests without a bearer token.
+    
+    Resolved before get_db in get_current_user, so unauthenticated requests
+    get their 401 without a database session being set up.
     """
     if credentials is None:
         raise HTTPException(
             status_code=401,
             detail="Authorization header missing"
         )
-    
+    return credentials
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(_require_bearer),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Authenticate user via API key from Authorization header.
+    Raises 401 if authentication fails.
+    """
     if db is None:
         raise HTTPException(
             status_code=503,
@@ -52,22 +128,26 @@ def get_current_user(
     
     # Extract API key from Bearer token
     api_key = credentials.credentials
+    mac = api_key_mac(api_key)
+    now = datetime.now(timezone.utc)
+    
+    # Fast path: key already verified recently, skip the key query
+    cached = _AUTH_CACHE.get(mac)
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at is None or expires_at > now:
+            user = await db.get(User, user_id)
+            if user is not None:
+                return user
     
-    # Find API key in database
-    api_keys = db.query(ApiKey).all()
-    matching_key: Optional[ApiKey] = None
-    
-    for key in api_keys:
-        if verify_api_key(api_key, key.key_hash):
-            # Check if key is expired
-            if key.expires_at and key.expires_at < datetime.now(timezone.utc):
-                continue
-            
-            matching_key = key
-            # Update last_used_at
-            key.last_used_at = datetime.now(timezone.utc)
-            db.commit()
-            break
+    # Find API key by its HMAC; the indexed equality match is the verification
+    result = await db.execute(
+        select(ApiKey).where(
+            ApiKey.key_mac == mac,
+            or_(ApiKey.expires_at.is_(None), ApiKey.expires_at > now)
+        )
+    )
+    matching_key: Optional[ApiKey] = result.scalars().first()
     
     if matching_key is None:
         raise HTTPException(
@@ -75,90 +155,73 @@ def get_current_user(
             detail="Invalid or expired API key"
         )
     
+    # Update last_used_at, throttled so a busy key doesn't commit on every request
+    if matching_key.last_used_at is None or now - matching_key.last_used_at > _LAST_USED_UPDATE_INTERVAL:
+        matching_key.last_used_at = now
+    
+    if db.dirty:
+        await db.commit()
+    
     # Get user
-    user = db.query(User).filter(User.id == matching_key.user_id).first()
+    user = await db.get(User, matching_key.user_id)
     if user is None:
         raise HTTPException(
             status_code=404,
             detail="User not found"
         )
     
+    _AUTH_CACHE[mac] = (user.id, matching_key.expires_at)
+    
     return user
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(current_user: User = Depends(get_current_user)) -> UserResponse:
+async def get_me(current_user: User = Depends(get_current_user)) -> UserResponse:
     """
     Get current authenticated user information.
     
     Requires valid API key in Authorization header.
     Returns 401 if authentication fails.
     """
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        created_at=current_user.created_at.isoformat() + "Z"
-    )
+    return UserResponse.model_validate(current_user)
 
 
 @router.get("/admin/api-key")
-def get_admin_api_key(db: Session = Depends(get_db)):
+async def get_admin_api_key(db: AsyncSession = Depends(get_db)):
     """
     Get the seeded admin API key.
     
     This endpoint tries to read from file first, if not found,
     it will generate a new one from the database (if seed ran successfully).
     """
-    import os
-    from pathlib import Path
-    
-    # Try multiple file paths
-    possible_paths = [
-        Path("admin_api_key.txt"),
-        Path("/tmp/admin_api_key.txt"),
-        Path("/app/admin_api_key.txt"),
-        Path("./admin_api_key.txt"),
-    ]
-    
-    key_file_path = None
-    for path in possible_paths:
-        if path.exists():
-            key_file_path = path
-            break
-    
-    # If file exists, read from it
-    if key_file_path:
-        try:
-            with open(key_file_path, "r") as f:
-                content = f.read().strip()
-                lines = content.split("\n")
-                api_key = None
-                email = None
-                
-                for line in lines:
-                    if line.startswith("API Key:"):
-                        api_key = line.replace("API Key:", "").strip()
-                    elif line.startswith("Email:"):
-                        email = line.replace("Email:", "").strip()
-                
-                if api_key:
-                    return {
-                        "email": email or "admin@forgeflow.local",
-                        "api_key": api_key,
-                        "source": "file",
-                        "message": "⚠️ IMPORTANT: Copy this API key. It will not be shown again after you use it!"
-                    }
-        except Exception as e:
-            pass  # Fall through to DB check
+    # Try the key file first
+    try:
+        key_file = _read_admin_key_file()
+    except Exception:
+        key_file = None  # Fall through to DB check
+    
+    if key_file is not None:
+        email, api_key = key_file
+        if api_key:
+            return {
+                "email": email or "admin@forgeflow.local",
+                "api_key": api_key,
+                "source": "file",
+                "message": "⚠️ IMPORTANT: Copy this API key. It will not be shown again after you use it!"
+            }
     
     # If file not found, try to get from database (if seed ran)
     if db is not None:
         try:
             # Check if admin user exists
-            admin_user = db.query(User).filter(User.email == "admin@forgeflow.local").first()
+            admin_user = (await db.execute(
+                select(User).where(User.email == "admin@forgeflow.local")
+            )).scalars().first()
             if admin_user:
                 # Get the first API key for admin user
-                api_key_obj = db.query(ApiKey).filter(ApiKey.user_id == admin_user.id).first()
+                api_key_obj = (await db.execute(
+                    select(ApiKey).where(ApiKey.user_id == admin_user.id)
+                )).scalars().first()
                 if api_key_obj:
                     return {
                         "email": admin_user.email,
@@ -0,0 +1,2 @@
+# Values shared by the OpenAPI response examples of all routers
+EXAMPLE_TIMESTAMP = "2025-12-31T00:00:00Z"
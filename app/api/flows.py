@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Path
-from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import bindparam, exists, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.auth import get_current_user
+from app.api.examples import EXAMPLE_TIMESTAMP
 from app.db.session import get_db
 from app.models.user import User
 from app.models.project import Project
@@ -13,6 +15,21 @@ from app.models.flow_run import FlowRun, FlowRunStatus
 
 router = APIRouter(tags=["flows"])
 
+# Ownership checks, built once; compiled SQL is reused from the engine's cache.
+_OWNED_PROJECT_STMT = select(Project.id).where(
+    Project.id == bindparam("pid"),
+    Project.owner_id == bindparam("uid")
+)
+
+# EXISTS lets Postgres answer from the indexes without returning a row.
+_OWNED_FLOW_STMT = select(
+    exists().where(
+        Flow.id == bindparam("fid"),
+        Flow.project_id == Project.id,
+        Project.owner_id == bindparam("uid")
+    )
+)
+
 
 # Request/Response Models
 class ProjectCreate(BaseModel):
@@ -25,19 +42,21 @@ class ProjectResponse(BaseModel):
     id: int = Field(..., description="Project ID")
     owner_id: int = Field(..., description="Owner user ID")
     name: str = Field(..., description="Project name")
-    created_at: str = Field(..., description="ISO 8601 timestamp in UTC")
-    updated_at: str = Field(..., description="ISO 8601 timestamp in UTC")
+    created_at: datetime = Field(..., description="ISO 8601 timestamp in UTC")
+    updated_at: datetime = Field(..., description="ISO 8601 timestamp in UTC")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "owner_id": 1,
                 "name": "My Project",
-                "created_at": "2025-12-31T00:00:00Z",
-                "updated_at": "2025-12-31T00:00:00Z"
+                "created_at": EXAMPLE_TIMESTAMP,
+                "updated_at": EXAMPLE_TIMESTAMP
             }
         }
+    )
 
 
 class FlowCreate(BaseModel):
@@ -53,20 +72,22 @@ class FlowResponse(BaseModel):
     project_id: int = Field(..., description="Project ID")
     name: str = Field(..., description="Flow name")
     description: Optional[str] = Field(None, description="Flow description")
-    created_at: str = Field(..., description="ISO 8601 timestamp in UTC")
-    updated_at: str = Field(..., description="ISO 8601 timestamp in UTC")
+    created_at: datetime = Field(..., description="ISO 8601 timestamp in UTC")
+    updated_at: datetime = Field(..., description="ISO 8601 timestamp in UTC")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "project_id": 1,
                 "name": "My Flow",
                 "description": "Flow description",
-                "created_at": "2025-12-31T00:00:00Z",
-                "updated_at": "2025-12-31T00:00:00Z"
+                "created_at": EXAMPLE_TIMESTAMP,
+                "updated_at": EXAMPLE_TIMESTAMP
             }
         }
+    )
 
 
 class FlowRunResponse(BaseModel):
@@ -74,28 +95,30 @@ class FlowRunResponse(BaseModel):
     id: int = Field(..., description="Flow run ID")
     flow_id: int = Field(..., description="Flow ID")
     status: str = Field(..., description="Flow run status")
-    created_at: str = Field(..., description="ISO 8601 timestamp in UTC")
-    started_at: Optional[str] = Field(None, description="ISO 8601 timestamp in UTC")
-    completed_at: Optional[str] = Field(None, description="ISO 8601 timestamp in UTC")
+    created_at: datetime = Field(..., description="ISO 8601 timestamp in UTC")
+    started_at: Optional[datetime] = Field(None, description="ISO 8601 timestamp in UTC")
+    completed_at: Optional[datetime] = Field(None, description="ISO 8601 timestamp in UTC")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "flow_id": 1,
                 "status": "pending",
-                "created_at": "2025-12-31T00:00:00Z",
+                "created_at": EXAMPLE_TIMESTAMP,
                 "started_at": None,
                 "completed_at": None
             }
         }
+    )
 
 
 @router.post("/projects", response_model=ProjectResponse, status_code=201)
-def create_project(
+async def create_project(
     project_data: ProjectCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> ProjectResponse:
     """
     Create a new project.
@@ -108,29 +131,23 @@ def create_project(
             detail="Database not available"
         )
     
-    project = Project(
-        owner_id=current_user.id,
-        name=project_data.name
-    )
-    
-    db.add(project)
-    db.commit()
-    db.refresh(project)
+    # INSERT ... RETURNING brings back server defaults without a refresh SELECT
+    project = (await db.execute(
+        insert(Project).values(
+            owner_id=current_user.id,
+            name=project_data.name
+        ).returning(Project.id, Project.owner_id, Project.name, Project.created_at, Project.updated_at)
+    )).one()
+    await db.commit()
     
-    return ProjectResponse(
-        id=project.id,
-        owner_id=project.owner_id,
-        name=project.name,
-        created_at=project.created_at.isoformat() + "Z",
-        updated_at=project.updated_at.isoformat() + "Z"
-    )
+    return ProjectResponse.model_validate(project)
 
 
 @router.post("/flows", response_model=FlowResponse, status_code=201)
-def create_flow(
+async def create_flow(
     flow_data: FlowCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> FlowResponse:
     """
     Create a new flow in a project.
@@ -145,42 +162,33 @@ def create_flow(
         )
     
     # Verify project exists and belongs to user
-    project = db.query(Project).filter(
-        Project.id == flow_data.project_id,
-        Project.owner_id == current_user.id
-    ).first()
+    project_id = (await db.execute(
+        _OWNED_PROJECT_STMT, {"pid": flow_data.project_id, "uid": current_user.id}
+    )).scalar()
     
-    if project is None:
+    if project_id is None:
         raise HTTPException(
             status_code=404,
             detail="Project not found or access denied"
         )
     
-    flow = Flow(
-        project_id=flow_data.project_id,
-        name=flow_data.name,
-        description=flow_data.description
-    )
-    
-    db.add(flow)
-    db.commit()
-    db.refresh(flow)
+    flow = (await db.execute(
+        insert(Flow).values(
+            project_id=flow_data.project_id,
+            name=flow_data.name,
+            description=flow_data.description
+        ).returning(Flow.id, Flow.project_id, Flow.name, Flow.description, Flow.created_at, Flow.updated_at)
+    )).one()
+    await db.commit()
     
-    return FlowResponse(
-        id=flow.id,
-        project_id=flow.project_id,
-        name=flow.name,
-        description=flow.description,
-        created_at=flow.created_at.isoformat() + "Z",
-        updated_at=flow.updated_at.isoformat() + "Z"
-    )
+    return FlowResponse.model_validate(flow)
 
 
 @router.post("/flows/{flow_id}/run", response_model=FlowRunResponse, status_code=201)
-def run_flow(
+async def run_flow(
     flow_id: int = Path(..., description="Flow ID"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> FlowRunResponse:
     """
     Create a flow run (execution record) for a flow.
@@ -196,33 +204,24 @@ def run_flow(
         )
     
     # Verify flow exists and belongs to user's project
-    flow = db.query(Flow).join(Project).filter(
-        Flow.id == flow_id,
-        Project.owner_id == current_user.id
-    ).first()
+    flow_owned = (await db.execute(
+        _OWNED_FLOW_STMT, {"fid": flow_id, "uid": current_user.id}
+    )).scalar()
     
-    if flow is None:
+    if not flow_owned:
         raise HTTPException(
             status_code=404,
             detail="Flow not found or access denied"
         )
     
     # Create flow run
-    flow_run = FlowRun(
-        flow_id=flow_id,
-        status=FlowRunStatus.PENDING
-    )
-    
-    db.add(flow_run)
-    db.commit()
-    db.refresh(flow_run)
-    
-    return FlowRunResponse(
-        id=flow_run.id,
-        flow_id=flow_run.flow_id,
-        status=flow_run.status.value,
-        created_at=flow_run.created_at.isoformat() + "Z",
-        started_at=flow_run.started_at.isoformat() + "Z" if flow_run.started_at else None,
-        completed_at=flow_run.completed_at.isoformat() + "Z" if flow_run.completed_at else None
-    )
+    flow_run = (await db.execute(
+        insert(FlowRun).values(
+            flow_id=flow_id,
+            status=FlowRunStatus.PENDING
+        ).returning(FlowRun.id, FlowRun.flow_id, FlowRun.status, FlowRun.created_at, FlowRun.started_at, FlowRun.completed_at)
+    )).one()
+    await db.commit()
+    
+    return FlowRunResponse.model_validate(flow_run)
 
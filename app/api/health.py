@@ -1,40 +1,122 @@
-from datetime import datetime
+import asyncio
+import time
 from typing import Optional
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from app.api.examples import EXAMPLE_TIMESTAMP
+from app.api.health_interceptor import liveness_body, utc_timestamp
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_async_engine, ping_engine
 
 router = APIRouter(tags=["health"])
 
+# Last readiness ping result (monotonic time, db_ok, db_error), reused by probes within the TTL
+_HEALTH_CACHE: tuple[float, bool, Optional[str]] = (0.0, False, None)
+_HEALTH_CACHE_TTL = 1.0
+# Upper bound on a single ping, so a stalled database can't hang load-balancer probes
+_HEALTH_PING_TIMEOUT = 1.0
+_health_lock = asyncio.Lock()
+
+# Serialized readiness body (epoch second, db_ok, db_error, body), rebuilt when the second or the ping result changes
+_READY_BODY: tuple[int, bool, Optional[str], bytes] = (-1, False, None, b"")
+
+
+class LivenessResponse(BaseModel):
+    """Liveness check response model."""
+    status: str = Field(..., description="Application status", examples=["ok"])
+    timestamp: str = Field(..., description="ISO 8601 timestamp in UTC", examples=[EXAMPLE_TIMESTAMP])
+    env: str = Field(..., description="Environment name", examples=["local"])
+
 
 class HealthResponse(BaseModel):
-    """Health check response model."""
-    status: str = Field(..., description="Application status", example="ok")
-    timestamp: str = Field(..., description="ISO 8601 timestamp in UTC", example="2025-12-31T00:00:00Z")
-    env: str = Field(..., description="Environment name", example="local")
+    """Readiness check response model."""
+    status: str = Field(..., description="Application status", examples=["ok"])
+    timestamp: str = Field(..., description="ISO 8601 timestamp in UTC", examples=[EXAMPLE_TIMESTAMP])
+    env: str = Field(..., description="Environment name", examples=["local"])
     db_ok: bool = Field(..., description="Database connectivity status")
-    db_error: Optional[str] = Field(None, description="Database error message if connection failed", example=None)
+    db_error: Optional[str] = Field(None, description="Database error message if connection failed", examples=[None])
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "ok",
-                "timestamp": "2025-12-31T00:00:00Z",
+                "timestamp": EXAMPLE_TIMESTAMP,
                 "env": "local",
                 "db_ok": True,
                 "db_error": None
             }
         }
+    )
+
+
+async def _check_db(engine: AsyncEngine) -> tuple[bool, Optional[str]]:
+    """Ping the database, reusing a result younger than the cache TTL."""
+    global _HEALTH_CACHE
+
+    checked_at, db_ok, db_error = _HEALTH_CACHE
+    if time.monotonic() - checked_at < _HEALTH_CACHE_TTL:
+        return db_ok, db_error
+
+    async with _health_lock:
+        # Another probe may have refreshed the result while we waited
+        checked_at, db_ok, db_error = _HEALTH_CACHE
+        if time.monotonic() - checked_at < _HEALTH_CACHE_TTL:
+            return db_ok, db_error
+
+        try:
+            async with asyncio.timeout(_HEALTH_PING_TIMEOUT):
+                await ping_engine(engine)
+            db_ok, db_error = True, None
+        except TimeoutError:
+            db_ok, db_error = False, "Database ping timed out"
+        except Exception as e:
+            db_ok, db_error = False, str(e)
+
+        _HEALTH_CACHE = (time.monotonic(), db_ok, db_error)
+
+    return db_ok, db_error
 
 
-@router.get("/health", response_model=HealthResponse)
-def health(db: Session = Depends(get_db)) -> HealthResponse:
+def _ready_body(db_ok: bool, db_error: Optional[str]) -> bytes:
+    global _READY_BODY
+
+    now = int(time.time())
+    second, cached_ok, cached_error, body = _READY_BODY
+    if (second, cached_ok, cached_error) != (now, db_ok, db_error):
+        body = orjson.dumps({
+            "status": "ok",
+            "timestamp": utc_timestamp(now),
+            "env": settings.ENV,
+            "db_ok": db_ok,
+            "db_error": db_error,
+        })
+        _READY_BODY = (now, db_ok, db_error, body)
+    return body
+
+
+# Both endpoints return pre-serialized JSON; response models stay for the OpenAPI schema only
+@router.get("/health", response_model=None, responses={200: {"model": LivenessResponse}})
+async def health() -> Response:
+    """
+    Liveness check endpoint. Returns application status without touching the database.
+    
+    Plain GET probes are answered by HealthCheckInterceptor before reaching
+    this handler; it serves requests the interceptor passes through.
+    
+    Returns:
+        LivenessResponse: Application status
     """
-    Health check endpoint. Returns application status and database connectivity.
+    return Response(liveness_body(), media_type="application/json")
+
+
+@router.get("/health/ready", response_model=None, responses={200: {"model": HealthResponse}})
+async def health_ready() -> Response:
+    """
+    Readiness check endpoint. Returns application status and database connectivity.
     
     Returns:
         HealthResponse: Health status with database connectivity information
@@ -42,20 +124,11 @@ def health(db: Session = Depends(get_db)) -> HealthResponse:
     db_ok = False
     db_error: Optional[str] = None
 
-    if db is None:
+    engine = get_async_engine()
+    if engine is None:
         db_error = "DATABASE_URL not set or database not configured"
     else:
-        try:
-            db.execute(text("SELECT 1"))
-            db_ok = True
-        except Exception as e:
-            db_error = str(e)
-
-    return HealthResponse(
-        status="ok",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        env=settings.ENV,
-        db_ok=db_ok,
-        db_error=db_error,
-    )
+        db_ok, db_error = await _check_db(engine)
+
+    return Response(_ready_body(db_ok, db_error), media_type="application/json")
 
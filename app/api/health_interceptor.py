@@ -0,0 +1,75 @@
+import time
+
+import orjson
+
+from app.core.config import settings
+
+HEALTH_PATH = "/health"
+
+# Fixed for the life of the process
+_ENV = settings.ENV
+
+_METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+
+# Liveness body, re-serialized at most once per second (the timestamp has second resolution)
+_body_second = -1
+_body = b""
+
+
+def utc_timestamp(seconds: int) -> str:
+    """Format epoch seconds as an ISO 8601 UTC timestamp with a Z suffix."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+def liveness_body() -> bytes:
+    """Serialized liveness response for the current second."""
+    global _body_second, _body
+    now = int(time.time())
+    if now != _body_second:
+        _body = orjson.dumps({
+            "status": "ok",
+            "timestamp": utc_timestamp(now),
+            "env": _ENV,
+        })
+        _body_second = now
+    return _body
+
+
+def _has_origin(scope) -> bool:
+    return any(name == b"origin" for name, _ in scope["headers"])
+
+
+class HealthCheckInterceptor:
+    """
+    Pure ASGI wrapper that answers liveness probes on /health directly.
+
+    Probes skip the middleware stack, routing, dependency injection and
+    response-model validation. Requests with an Origin header (browsers) fall
+    through to the app so CORS is still applied. Database readiness is served
+    by the app itself on /health/ready.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != HEALTH_PATH or _has_origin(scope):
+            await self.app(scope, receive, send)
+            return
+
+        # HEAD is answered like GET; the server drops the body
+        if scope["method"] in ("GET", "HEAD"):
+            status, body, headers = 200, liveness_body(), []
+        else:
+            status, body, headers = 405, _METHOD_NOT_ALLOWED_BODY, [(b"allow", b"GET, HEAD")]
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                *headers,
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,3 +1,4 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -6,8 +7,18 @@ class Settings(BaseSettings):
     ENV: str = "local"
     DATABASE_URL: str = ""
     JWT_SECRET: str = "change-me"
+    # Server secret for API key HMACs; changing it invalidates all issued keys.
+    # Startup refuses the default outside ENV=local.
+    API_KEY_SECRET: str = "change-me"
     CORS_ORIGINS: str = "*"
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """CORS_ORIGINS split into individual origins, parsed once per settings instance."""
+        if self.CORS_ORIGINS == "*":
+            return ("*",)
+        return tuple(o.strip() for o in self.CORS_ORIGINS.split(","))
+
 settings = Settings()
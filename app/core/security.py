@@ -1,37 +1,20 @@
+import hashlib
+import hmac
 from datetime import datetime
-from passlib.context import CryptContext
 
-# API key hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
 
+# HMAC keyed with the server secret; copied per key so the key schedule is computed once
+_API_KEY_HMAC = hmac.new(settings.API_KEY_SECRET.encode('utf-8'), digestmod=hashlib.sha256)
 
-def hash_api_key(api_key: str) -> str:
-    """Hash an API key using bcrypt.
-    
-    Bcrypt has a 72 byte limit, so we truncate if necessary.
-    We use a safety margin of 60 bytes to avoid any edge cases.
-    """
-    # Bcrypt limit is 72 bytes, use 60 as safety margin
-    api_key_bytes = api_key.encode('utf-8')
-    if len(api_key_bytes) > 60:
-        # Truncate to 60 bytes for safety
-        api_key_bytes = api_key_bytes[:60]
-        # Decode back to string, ignoring any incomplete UTF-8 sequences
-        api_key = api_key_bytes.decode('utf-8', errors='ignore')
-    # Ensure we're passing a string that's definitely under 72 bytes
-    return pwd_context.hash(api_key)
 
-
-def verify_api_key(plain_key: str, hashed_key: str) -> bool:
-    """Verify an API key against its hash.
+def api_key_mac(api_key: str) -> bytes:
+    """Compute the keyed lookup value stored for an API key.
     
-    Bcrypt has a 72 byte limit, so we truncate if necessary (same as hash).
-    We use a safety margin of 60 bytes to match hash behavior.
+    API keys are random server-generated secrets, not user-chosen passwords,
+    so a slow KDF adds nothing: HMAC-SHA256 under the server secret is stored
+    in an indexed column and authentication is a single lookup.
     """
-    # Bcrypt limit is 72 bytes, use 60 as safety margin (must match hash behavior)
-    plain_key_bytes = plain_key.encode('utf-8')
-    if len(plain_key_bytes) > 60:
-        plain_key_bytes = plain_key_bytes[:60]
-        plain_key = plain_key_bytes.decode('utf-8', errors='ignore')
-    return pwd_context.verify(plain_key, hashed_key)
-
+    mac = _API_KEY_HMAC.copy()
+    mac.update(api_key.encode('utf-8'))
+    return mac.digest()
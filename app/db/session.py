@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from typing import Optional
 
@@ -7,14 +9,53 @@ from app.core.config import settings
 # Lazy initialization - only create engine when needed
 _engine: Optional[object] = None
 _SessionLocal: Optional[sessionmaker] = None
+_async_engine: Optional[object] = None
+_AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+# Pool settings shared by the sync and async engines. The default QueuePool(5)
+# queues bursts of concurrent requests; LIFO keeps a warm subset of connections
+# in use, and recycling drops connections before server/proxy idle timeouts.
+# No pre-ping: it costs a round trip on every checkout, and recycling plus
+# SQLAlchemy's invalidation on disconnect errors covers dropped connections.
+# A request that cannot get a connection within pool_timeout fails fast.
+_POOL_OPTIONS = dict(
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    pool_timeout=5,
+    pool_use_lifo=True,
+)
+
+# libpq connection options: bound connection setup and server-side statement time
+_PG_CONNECT_ARGS = {"connect_timeout": 3, "options": "-c statement_timeout=2000"}
+
+
+def _database_configured() -> bool:
+    return bool(settings.DATABASE_URL and settings.DATABASE_URL.strip())
+
+
+def _async_database_url(url: str):
+    """Map the configured URL onto psycopg 3, which also provides the asyncio driver."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+psycopg")
+    return parsed
+
+
+def _engine_options(url) -> dict:
+    options = dict(_POOL_OPTIONS)
+    if make_url(url).get_backend_name() == "postgresql":
+        options["connect_args"] = _PG_CONNECT_ARGS
+    return options
 
 
 def get_engine():
     """Get or create the database engine."""
     global _engine
     if _engine is None:
-        if settings.DATABASE_URL and settings.DATABASE_URL.strip():
-            _engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+        if _database_configured():
+            _engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
     return _engine
 
 
@@ -28,15 +69,39 @@ def get_session_local():
     return _SessionLocal
 
 
-def get_db():
-    """Dependency for getting database session."""
-    SessionLocal = get_session_local()
-    if SessionLocal is None:
+def get_async_engine():
+    """Get or create the async database engine used by request handlers."""
+    global _async_engine
+    if _async_engine is None:
+        if _database_configured():
+            url = _async_database_url(settings.DATABASE_URL)
+            _async_engine = create_async_engine(url, **_engine_options(url))
+    return _async_engine
+
+
+def get_async_session_local():
+    """Get or create the async session maker."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        engine = get_async_engine()
+        if engine is not None:
+            # expire_on_commit=False: attribute access after commit must not trigger implicit IO
+            _AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
+async def get_db():
+    """Dependency for getting an async database session."""
+    AsyncSessionLocal = get_async_session_local()
+    if AsyncSessionLocal is None:
         yield None
         return
-    
-    db = SessionLocal()
-    try:
+
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def ping_engine(engine) -> None:
+    """Round-trip to the database on a plain connection, skipping the ORM session and SQL compilation."""
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SELECT 1")
@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey, func
+from sqlalchemy import LargeBinary, String, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -10,7 +10,9 @@ class ApiKey(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
     
-    key_hash: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    key_mac: Mapped[bytes | None] = mapped_column(LargeBinary(32), unique=True, index=True, nullable=True)
+    # Bcrypt hash of keys issued before key_mac; no longer accepted
+    key_hash: Mapped[str | None] = mapped_column(String(255), unique=True, index=True, nullable=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
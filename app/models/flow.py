@@ -1,4 +1,4 @@
-from sqlalchemy import String, Text, DateTime, ForeignKey, func
+from sqlalchemy import Index, String, Text, DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -6,9 +6,10 @@ from app.db.base import Base
 
 class Flow(Base):
     __tablename__ = "flows"
+    __table_args__ = (Index("ix_flows_project_id_id", "project_id", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), index=True, nullable=False)
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -16,6 +17,6 @@ class Flow(Base):
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
-    project = relationship("Project", back_populates="flows")
+    project = relationship("Project", back_populates="flows", lazy="selectin")
     runs = relationship("FlowRun", back_populates="flow", cascade="all, delete-orphan")
 
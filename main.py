@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import secrets
 import logging
@@ -10,13 +11,15 @@ sys.path.insert(0, str(project_root))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import settings and routers from app package
-from app.core.config import settings
-from app.core.security import hash_api_key
+from app.core.config import Settings, settings
+from app.core.security import api_key_mac
 from app.api.health import router as health_router
 from app.api.auth import router as auth_router
 from app.api.flows import router as flows_router
+from app.api.health_interceptor import HealthCheckInterceptor
 from app.db.session import get_session_local
 from app.models.user import User
 from app.models.api_key import ApiKey
@@ -26,7 +29,7 @@ logger = logging.getLogger(__name__)
 
 
 def seed_admin_user():
-    """Seed admin user and API key if database is empty."""
+    """Seed admin user and API key if database is empty, or re-issue the admin key if it has none usable."""
     SessionLocal = get_session_local()
     if SessionLocal is None:
         logger.warning("Database not configured, skipping admin user seed")
@@ -34,46 +37,44 @@ def seed_admin_user():
     
     db = SessionLocal()
     try:
-        # Check if any user exists
-        user_count = db.query(User).count()
+        # Check if any user exists; EXISTS stops at the first row instead of counting the table
+        users_exist = db.query(db.query(User).exists()).scalar()
         
-        if user_count > 0:
-            logger.info("Users already exist, skipping admin user seed")
-            return
-        
-        # Create admin user
-        admin_user = User(
-            email="admin@forgeflow.local",
-            password_hash="dummy_hash_for_seeded_user"  # Not used for API key auth
-        )
-        db.add(admin_user)
-        db.flush()  # Get the user ID
+        if users_exist:
+            # Bcrypt-hashed keys issued before key_mac are no longer accepted, so an
+            # admin holding only such keys gets one replacement key
+            admin_user = db.query(User).filter(User.email == "admin@forgeflow.local").first()
+            if admin_user is None or db.query(
+                db.query(ApiKey).filter(ApiKey.user_id == admin_user.id, ApiKey.key_mac.isnot(None)).exists()
+            ).scalar():
+                logger.info("Users already exist, skipping admin user seed")
+                return
+            logger.info("Admin user has no usable API key, issuing a new one")
+        else:
+            # Create admin user
+            admin_user = User(
+                email="admin@forgeflow.local",
+                password_hash="dummy_hash_for_seeded_user"  # Not used for API key auth
+            )
+            db.add(admin_user)
+            db.flush()  # Get the user ID
         
-        # Generate API key (16 hex chars = 8 bytes + prefix = 19 chars = 19 bytes, well under 72 byte limit)
+        # Generate API key (16 hex chars = 8 bytes, plus "ff_" prefix)
         # Using hex to ensure consistent byte length
         random_bytes = secrets.token_bytes(8)  # 8 bytes = 16 hex chars
         api_key_plain = f"ff_{random_bytes.hex()}"
         
-        # Try to hash the API key
-        try:
-            api_key_hash = hash_api_key(api_key_plain)
-            
-            # Create API key
-            api_key = ApiKey(
-                user_id=admin_user.id,
-                key_hash=api_key_hash,
-                name="Admin API Key (Seeded)"
-            )
-            db.add(api_key)
-            db.commit()
-            logger.info("API key created and saved to database")
-        except Exception as hash_error:
-            logger.error(f"Failed to hash API key: {hash_error}")
-            logger.warning("API key will be shown but not saved to database. Fix bcrypt issue to enable authentication.")
-            db.rollback()
-            # Continue to show the key even if hash fails
+        # Create API key; only its HMAC is stored
+        api_key = ApiKey(
+            user_id=admin_user.id,
+            key_mac=api_key_mac(api_key_plain),
+            name="Admin API Key (Seeded)"
+        )
+        db.add(api_key)
+        db.commit()
+        logger.info("API key created and saved to database")
         
-        # Log and save the plaintext key (always, even if hash failed)
+        # Log and save the plaintext key
         logger.info("=" * 80)
         logger.info("ADMIN USER SEEDED")
         logger.info("=" * 80)
@@ -111,7 +112,11 @@ def seed_admin_user():
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     # Startup
-    seed_admin_user()
+    # API keys are HMAC'd under API_KEY_SECRET; the built-in default is public
+    if settings.ENV != "local" and settings.API_KEY_SECRET == Settings.model_fields["API_KEY_SECRET"].default:
+        raise RuntimeError("API_KEY_SECRET must be set when ENV is not 'local'")
+    # The seed uses the sync engine, so it runs in a thread to keep the event loop free
+    await asyncio.to_thread(seed_admin_user)
     yield
     # Shutdown (if needed in future)
 
@@ -124,13 +129,12 @@ def create_app() -> FastAPI:
         redoc_url=None,
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
-    origins = ["*"] if settings.CORS_ORIGINS == "*" else [o.strip() for o in settings.CORS_ORIGINS.split(",")]
-
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins,
+        allow_origins=settings.cors_origins_list,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -144,9 +148,11 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+# Liveness probes on /health are answered before the FastAPI stack
+app = HealthCheckInterceptor(create_app())
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=7860)
+    # uvloop/httptools ship with uvicorn[standard]; pin them rather than relying on auto-detection
+    uvicorn.run(app, host="0.0.0.0", port=7860, loop="uvloop", http="httptools")
 